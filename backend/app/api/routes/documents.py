@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from mimetypes import guess_type
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user, get_db, require_roles
@@ -17,7 +18,8 @@ from app.utils.pdf import render_document_pdf
 from app.utils.s3 import (
     S3ConfigError,
     delete_file_bytes,
-    download_file_bytes,
+    iter_stream_chunks,
+    open_file_stream,
     upload_file_bytes,
 )
 
@@ -214,9 +216,10 @@ def get_document_pdf(
     document = get_document_or_404(db, doc_id, current_user)
     filename = document.file_name or f"document_{document.id}.pdf"
     media_type = document.mime_type or "application/pdf"
+    file_stream = None
     if document.s3_key:
         try:
-            file_bytes = download_file_bytes(document.s3_key)
+            file_stream, content_length = open_file_stream(document.s3_key)
         except S3ConfigError as exc:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)
@@ -224,18 +227,27 @@ def get_document_pdf(
     else:
         file_bytes = render_document_pdf(document)
         media_type = "application/pdf"
-    log_document_event(
-        db,
-        user_id=current_user.id,
-        document_id=document.id,
-        event_type="document_generation",
-        metadata={"format": "file"},
-    )
-    return Response(
-        content=file_bytes,
-        media_type=media_type,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    try:
+        log_document_event(
+            db,
+            user_id=current_user.id,
+            document_id=document.id,
+            event_type="document_generation",
+            metadata={"format": "file"},
+        )
+    except Exception:
+        if file_stream is not None:
+            file_stream.close()
+        raise
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if file_stream is not None:
+        headers["Content-Length"] = str(content_length)
+        return StreamingResponse(
+            iter_stream_chunks(file_stream),
+            media_type=media_type,
+            headers=headers,
+        )
+    return Response(content=file_bytes, media_type=media_type, headers=headers)
 
 
 @router.delete("/{doc_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -356,18 +368,19 @@ def download_shared_document(token: str, db: Session = Depends(get_db)):
 
     filename = document.file_name or f"document_{document.id}.pdf"
     media_type = document.mime_type or "application/pdf"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
     if document.s3_key:
         try:
-            file_bytes = download_file_bytes(document.s3_key)
+            file_stream, content_length = open_file_stream(document.s3_key)
         except S3ConfigError as exc:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)
             ) from exc
-    else:
-        file_bytes = render_document_pdf(document)
-        media_type = "application/pdf"
-    return Response(
-        content=file_bytes,
-        media_type=media_type,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+        headers["Content-Length"] = str(content_length)
+        return StreamingResponse(
+            iter_stream_chunks(file_stream),
+            media_type=media_type,
+            headers=headers,
+        )
+    file_bytes = render_document_pdf(document, generated_at=now)
+    return Response(content=file_bytes, media_type="application/pdf", headers=headers)
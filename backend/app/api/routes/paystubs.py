@@ -3,6 +3,7 @@ import secrets
 from datetime import date
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import extract
 from sqlalchemy.orm import Session
 
@@ -13,7 +14,13 @@ from app.db.models.paystub import Paystub
 from app.db.models.user import User
 from app.schemas.paystub import PaystubListResponse, PaystubSummary
 from app.utils.pdf import render_paystub_pdf
-from app.utils.s3 import S3ConfigError, delete_pdf_bytes, download_pdf_bytes, upload_pdf_bytes
+from app.utils.s3 import (
+    S3ConfigError,
+    delete_pdf_bytes,
+    iter_stream_chunks,
+    open_pdf_stream,
+    upload_pdf_stream,
+)
 
 router = APIRouter()
 
@@ -108,28 +115,38 @@ def get_paystub_pdf(
     current_user: User = Depends(get_current_user),
 ):
     paystub = get_paystub_or_404(db, paystub_id, current_user)
+    pdf_stream = None
     if paystub.s3_key:
         try:
-            pdf_bytes = download_pdf_bytes(paystub.s3_key)
+            pdf_stream, content_length = open_pdf_stream(paystub.s3_key)
         except S3ConfigError as exc:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)
             ) from exc
     else:
         pdf_bytes = render_paystub_pdf(paystub)
-    log_paystub_event(
-        db,
-        user_id=current_user.id,
-        paystub_id=paystub.id,
-        event_type="paystub_generation",
-        metadata={"format": "pdf"},
-    )
+    try:
+        log_paystub_event(
+            db,
+            user_id=current_user.id,
+            paystub_id=paystub.id,
+            event_type="paystub_generation",
+            metadata={"format": "pdf"},
+        )
+    except Exception:
+        if pdf_stream is not None:
+            pdf_stream.close()
+        raise
     filename = paystub.file_name or build_paystub_filename(paystub)
-    return Response(
-        content=pdf_bytes,
-        media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
-    )
+    headers = {"Content-Disposition": f"attachment; filename={filename}"}
+    if pdf_stream is not None:
+        headers["Content-Length"] = str(content_length)
+        return StreamingResponse(
+            iter_stream_chunks(pdf_stream),
+            media_type="application/pdf",
+            headers=headers,
+        )
+    return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
 
 
 @router.post("/upload", response_model=PaystubSummary, status_code=status.HTTP_201_CREATED)
@@ -153,12 +170,7 @@ def upload_paystub(
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-    try:
-        file_bytes = file.file.read()
-    finally:
-        file.file.close()
-
-    if not file_bytes:
+    if not file.size:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Empty file")
 
     try:
@@ -177,13 +189,15 @@ def upload_paystub(
     )
 
     try:
-        upload_pdf_bytes(
+        upload_pdf_stream(
             s3_key,
-            file_bytes,
+            file.file,
             metadata={"user_id": str(user_id), "uploaded_by": str(current_user.id)},
         )
     except S3ConfigError as exc:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)) from exc
+    finally:
+        file.file.close()
 
     paystub = Paystub(
         user_id=user_id,
@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user, get_db, require_roles, require_write_access
@@ -28,7 +29,14 @@ from app.utils.email import (
     EmailDeliveryError,
     send_verification_email_with_attachment,
 )
-from app.utils.s3 import S3ConfigError, download_file_bytes, download_pdf_bytes, upload_pdf_bytes
+from app.utils.s3 import (
+    S3ConfigError,
+    download_file_bytes,
+    download_pdf_bytes,
+    iter_stream_chunks,
+    open_pdf_stream,
+    upload_pdf_bytes,
+)
 
 router = APIRouter()
 
@@ -464,21 +472,28 @@ def download_verification_letter(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Letter not available")
 
     try:
-        pdf_bytes = download_pdf_bytes(request.s3_key)
+        pdf_stream, content_length = open_pdf_stream(request.s3_key)
     except S3ConfigError as exc:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)) from exc
 
-    log_verification_event(
-        db,
-        user_id=current_user.id,
-        request_id=request.id,
-        event_type="verification_download",
-        metadata={"status": request.status.value},
-    )
+    try:
+        log_verification_event(
+            db,
+            user_id=current_user.id,
+            request_id=request.id,
+            event_type="verification_download",
+            metadata={"status": request.status.value},
+        )
+    except Exception:
+        pdf_stream.close()
+        raise
 
     filename = request.file_name or "employment_verification.pdf"
-    return Response(
-        content=pdf_bytes,
+    return StreamingResponse(
+        iter_stream_chunks(pdf_stream),
         media_type="application/pdf",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(content_length),
+        },
     )
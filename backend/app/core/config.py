@@ -20,6 +20,7 @@ class Settings(BaseSettings):
     base_url: str = "https://core.kyronix.ai"
     time_zone: str = "America/Los_Angeles"
     document_output_format: str = "pdf"
+    paystub_render_cache_dir: str | None = None
     environment: str = "development"
     company_address: str = "28 Geary St Suite 650 San Francisco, CA 94108"
     payroll_contact_email: str = "hr@northlinepremier.com"
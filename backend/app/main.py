@@ -1,10 +1,26 @@
+import threading
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes import auth, documents, paystub_generate, paystubs, users, verification_requests
 from app.core.config import settings
+from app.utils.s3 import get_s3_client, warm_s3_client
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Build the S3 client before serving requests: it does no network I/O,
+    # and boto3.client() on the shared default session is not thread-safe.
+    # Only the TLS handshake to the bucket runs in the background.
+    if settings.s3_bucket:
+        client = get_s3_client()
+        threading.Thread(target=warm_s3_client, args=(client,), daemon=True).start()
+    yield
+
 
-app = FastAPI(title=settings.project_name)
+app = FastAPI(title=settings.project_name, lifespan=lifespan)
 
 allowed_origins = [origin.strip() for origin in settings.allow_origins.split(",") if origin.strip()]
 
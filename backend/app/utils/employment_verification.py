@@ -3,7 +3,6 @@ import math
 import textwrap
 from datetime import date, datetime
 from pathlib import Path
-from zoneinfo import ZoneInfo
 
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.utils import ImageReader
@@ -12,8 +11,12 @@ from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.pdfgen import canvas
 
 from app.core.config import settings
+from app.utils.pdf import APP_TZ
 
 _REGISTERED_FONTS: set[str] = set()
+_GENERATED_FROM_HOST = (
+    settings.verification_generated_from_host.strip() or "core.northlinepremier.com"
+)
 
 
 def build_employment_verification_filename(employee_last_name: str, generated_on: datetime) -> str:
@@ -25,8 +28,6 @@ def build_employment_verification_filename(employee_last_name: str, generated_on
 
 
 def _format_date(value: date | datetime | None) -> str:
-    if isinstance(value, datetime):
-        return value.strftime("%B %d, %Y")
     if isinstance(value, date):
         return value.strftime("%B %d, %Y")
     return str(value) if value is not None else "N/A"
@@ -45,6 +46,10 @@ def _verification_employer_name() -> str:
     return settings.verification_employer_display_name.strip() or settings.employer_legal_name.strip()
 
 
+def _verification_contact_email() -> str:
+    return settings.verification_signer_email.strip() or settings.payroll_contact_email.strip()
+
+
 def _resolve_logo_path() -> Path | None:
     if settings.verification_logo_path:
         candidate = Path(settings.verification_logo_path)
@@ -67,11 +72,11 @@ def _resolve_logo_path() -> Path | None:
 def _register_font(font_name: str, font_path: str | None) -> str | None:
     if not font_path:
         return None
+    if font_name in _REGISTERED_FONTS:
+        return font_name
     candidate = Path(font_path)
     if not candidate.is_file():
         return None
-    if font_name in _REGISTERED_FONTS:
-        return font_name
     try:
         pdfmetrics.registerFont(TTFont(font_name, str(candidate)))
         _REGISTERED_FONTS.add(font_name)
@@ -80,6 +85,10 @@ def _register_font(font_name: str, font_path: str | None) -> str | None:
         return None
 
 
+_register_font("VerificationBody", settings.verification_body_font_path)
+_register_font("VerificationSignature", settings.verification_signature_font_path)
+
+
 def _draw_star(c: canvas.Canvas, center_x: float, center_y: float, size: float) -> None:
     outer = size / 2
     inner = outer * 0.5
@@ -135,9 +144,9 @@ def _draw_verification_header(
     y_top: float,
     page_width: float,
 ) -> float:
-    brand_name = settings.verification_employer_display_name.strip() or settings.employer_legal_name.strip()
+    brand_name = _verification_employer_name()
     subtitle = settings.verification_brand_subtitle.strip()
-    contact_email = settings.verification_signer_email.strip() or settings.payroll_contact_email.strip()
+    contact_email = _verification_contact_email()
     contact_phone = _format_phone_for_sentence(settings.verification_phone)
 
     logo_width = 0.0
@@ -251,11 +260,12 @@ def _draw_verification_header(
 def _draw_verification_footer(
     c: canvas.Canvas,
     *,
+    page_width: float,
     margin: float,
     footer_height: float,
     generated_at: datetime,
 ) -> None:
-    tz = ZoneInfo(settings.time_zone)
+    tz = APP_TZ
     footer_time = generated_at
     if footer_time.tzinfo is None:
         footer_time = footer_time.replace(tzinfo=tz)
@@ -263,11 +273,7 @@ def _draw_verification_footer(
         footer_time = footer_time.astimezone(tz)
     stamp = footer_time.strftime("%Y-%m-%d %H:%M:%S %Z")
 
-    page_width = c._pagesize[0]
-    generated_from_host = (
-        settings.verification_generated_from_host.strip() or "core.northlinepremier.com"
-    )
-    footer_line = f"This document was generated electronically via {generated_from_host}."
+    footer_line = f"This document was generated electronically via {_GENERATED_FROM_HOST}."
 
     c.setFont("Helvetica", 8)
     c.setFillColorRGB(0, 0, 0)
@@ -294,9 +300,14 @@ def render_employment_verification_pdf(
     employee_id: int,
 ) -> bytes:
     employer_name = _verification_employer_name()
+    signer_name = settings.verification_signer_name
+    signer_credentials = settings.verification_signer_credentials.strip()
+    signer_title = settings.verification_signer_title
+    contact_phone = _format_phone_for_sentence(settings.verification_phone)
+    contact_email = _verification_contact_email()
 
     buffer = io.BytesIO()
-    c = canvas.Canvas(buffer, pagesize=letter)
+    c = canvas.Canvas(buffer, pagesize=letter, pageCompression=1)
     c.setTitle("Employment Verification Letter")
     c.setAuthor(employer_name)
     c.setSubject(f"Employment Verification Request {request_id}")
@@ -316,7 +327,7 @@ def render_employment_verification_pdf(
 
     y = _draw_verification_header(c, x_left=x_left, y_top=y, page_width=page_width)
 
-    c.drawString(x_left, y, generated_at.strftime("%B %d, %Y"))
+    c.drawString(x_left, y, _format_date(generated_at))
     y -= line_height * 2
 
     c.drawString(x_left, y, "To Whom It May Concern,")
@@ -348,11 +359,6 @@ def render_employment_verification_pdf(
         y -= line_height + 4
     y -= 2
 
-    contact_phone = _format_phone_for_sentence(settings.verification_phone)
-    contact_email = (
-        settings.verification_signer_email.strip()
-        or settings.payroll_contact_email.strip()
-    )
     if contact_phone:
         contact_paragraph = (
             "If you have any questions or need any additional information, please feel free to "
@@ -371,8 +377,6 @@ def render_employment_verification_pdf(
     c.drawString(x_left, y, "Sincerely,")
     y -= line_height * 2
 
-    signer_name = settings.verification_signer_name
-    signer_credentials = settings.verification_signer_credentials.strip()
     c.setFont(signature_font, 18)
     c.drawString(x_left, y, signer_name)
     y -= line_height * 2.3
@@ -384,11 +388,12 @@ def render_employment_verification_pdf(
         c.drawString(x_left, y, signer_name)
     y -= line_height
 
-    if settings.verification_signer_title:
-        c.drawString(x_left, y, settings.verification_signer_title)
+    if signer_title:
+        c.drawString(x_left, y, signer_title)
 
     _draw_verification_footer(
         c,
+        page_width=page_width,
         margin=x_left,
         footer_height=72,
         generated_at=generated_at,
@@ -397,5 +402,4 @@ def render_employment_verification_pdf(
     c.showPage()
     c.save()
 
-    buffer.seek(0)
-    return buffer.read()
+    return buffer.getvalue()
@@ -6,9 +6,11 @@ from reportlab.pdfgen import canvas
 
 from app.schemas.paystub_generate import PaystubGenerateRequest
 
+_CENTS = Decimal("0.01")
+
 
 def _quantize(value: Decimal) -> Decimal:
-    return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return value.quantize(_CENTS, rounding=ROUND_HALF_UP)
 
 
 def _format_amount(
@@ -48,7 +50,7 @@ def render_paystub_adp_classic_pdf(payload: PaystubGenerateRequest) -> bytes:
     voluntary = [item for item in payload.deductions if item.category == "Voluntary Deductions"]
 
     buffer = io.BytesIO()
-    c = canvas.Canvas(buffer, pagesize=letter)
+    c = canvas.Canvas(buffer, pagesize=letter, pageCompression=1)
     c.setTitle(f"{payload.company.company_name} Earnings Statement")
     c.setAuthor(payload.company.company_name)
     c.setSubject(f"Paystub ID: {payload.metadata.paystub_id}")
@@ -325,5 +327,4 @@ def render_paystub_adp_classic_pdf(payload: PaystubGenerateRequest) -> bytes:
 
     c.showPage()
     c.save()
-    buffer.seek(0)
-    return buffer.read()
+    return buffer.getvalue()
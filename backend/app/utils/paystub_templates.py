@@ -3,7 +3,7 @@ from typing import Callable
 
 from app.schemas.paystub_generate import PaystubGenerateRequest
 from app.utils.paystub_adp_classic import render_paystub_adp_classic_pdf
-from app.utils.paystub_v1 import render_paystub_v1_pdf
+from app.utils.paystub_v1 import render_paystub_v1_pdf_cached
 
 
 @dataclass(frozen=True)
@@ -29,7 +29,7 @@ PAYSTUB_TEMPLATES = (
             "payment_company",
             "leave_balances",
         ),
-        render_pdf=render_paystub_v1_pdf,
+        render_pdf=render_paystub_v1_pdf_cached,
     ),
     PaystubTemplateDefinition(
         id="adp_classic_v1",
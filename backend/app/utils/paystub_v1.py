@@ -1,20 +1,54 @@
+import hashlib
 import io
-import re
+import string
+import tempfile
 from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
+from functools import lru_cache, partial
+from pathlib import Path
 from decimal import Decimal, ROUND_HALF_UP
 
 from reportlab.lib.pagesizes import letter
+from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfgen import canvas
 
 from app.core.config import settings
 from app.schemas.paystub_generate import PaystubGenerateRequest
-from app.utils.pdf import draw_paystub_style_footer
+from app.utils.pdf import (
+    APP_TZ,
+    StateTrackingCanvas,
+    add_text_row,
+    draw_paystub_style_footer,
+    format_footer_stamp,
+)
+
+# Bump whenever the rendered bytes change so cached PDFs are not reused. This
+# covers render_paystub_v1_pdf and the app.utils.pdf helpers it draws with
+# (StateTrackingCanvas, add_text_row, draw_paystub_style_footer,
+# format_footer_stamp).
+_RENDER_VERSION = "1"
+_CENTS = Decimal("0.01")
+_DASH = "-"
+_WIDTH_TABLES: dict[tuple[str, float], tuple[float, ...]] = {
+    (font_name, font_size): tuple(
+        pdfmetrics.stringWidth(chr(code), font_name, font_size) for code in range(256)
+    )
+    for font_name in ("Helvetica", "Helvetica-Bold")
+    for font_size in (8.5, 9, 10, 11, 14, 18)
+}
 
 
 def _format_currency(value: Decimal) -> str:
-    quantized = value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-    return f"${quantized:,.2f}"
+    return _format_currency_cached(value, value.is_signed())
+
+
+# ``signed`` is part of the cache key because Decimal("-0") hashes equal to
+# Decimal("0") but formats as "$-0.00".
+@lru_cache(maxsize=512)
+def _format_currency_cached(value: Decimal, signed: bool) -> str:
+    cents = abs(int((value * 100).to_integral_value(rounding=ROUND_HALF_UP)))
+    dollars, remainder = divmod(cents, 100)
+    sign = "-" if signed else ""
+    return f"${sign}{dollars:,}.{remainder:02d}"
 
 
 def _format_rate(value: Decimal, pay_type: str) -> str:
@@ -23,27 +57,38 @@ def _format_rate(value: Decimal, pay_type: str) -> str:
 
 
 def _format_optional_decimal(value: Decimal | None) -> str:
-    if value is None:
-        return "-"
-    quantized = value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-    return f"{quantized:.2f}"
+    return _DASH if value is None else _format_hours(value)
 
 
 def _format_optional_currency(value: Decimal | None) -> str:
-    if value is None:
-        return "-"
-    return _format_currency(value)
+    return _DASH if value is None else _format_currency(value)
 
 
 def _format_hours(value: Decimal) -> str:
-    quantized = value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return _format_hours_cached(value, value.is_signed())
+
+
+@lru_cache(maxsize=512)
+def _format_hours_cached(value: Decimal, signed: bool) -> str:
+    quantized = value.quantize(_CENTS, rounding=ROUND_HALF_UP)
     return f"{quantized:.2f}"
 
 
+# str.translate table: ASCII letters/digits map to themselves, anything else is dropped.
+class _AsciiAlnumTable(dict):
+    def __missing__(self, key: int) -> None:
+        return None
+
+
+_FILENAME_CHARS = _AsciiAlnumTable(
+    (ord(ch), ord(ch)) for ch in string.ascii_letters + string.digits
+)
+
+
 def _format_last_name(employee_name: str) -> str:
     parts = employee_name.strip().split()
     last_name = parts[-1] if parts else "EMPLOYEE"
-    cleaned = re.sub(r"[^A-Za-z0-9]", "", last_name).upper()
+    cleaned = last_name.translate(_FILENAME_CHARS).upper()
     return cleaned or "EMPLOYEE"
 
 
@@ -53,8 +98,17 @@ def build_paystub_filename(payload: PaystubGenerateRequest) -> str:
     return f"KYRONIX_PAYSTUB_{last_name}_{pay_date}.pdf"
 
 
+def _text_width(text: str, font_name: str, font_size: float) -> float:
+    table = _WIDTH_TABLES.get((font_name, font_size))
+    if table is not None:
+        try:
+            return sum(map(table.__getitem__, map(ord, text)))
+        except IndexError:
+            pass
+    return pdfmetrics.stringWidth(text, font_name, font_size)
+
+
 def _wrap_text(
-    c: canvas.Canvas,
     text: str,
     max_width: float,
     font_name: str,
@@ -63,208 +117,269 @@ def _wrap_text(
     words = text.split()
     if not words:
         return [""]
+    single_line = " ".join(words)
+    if _text_width(single_line, font_name, font_size) <= max_width:
+        return [single_line]
+    space_width = _text_width(" ", font_name, font_size)
     lines: list[str] = []
     current = ""
+    current_width = 0.0
     for word in words:
-        candidate = f"{current} {word}".strip()
-        if not current or c.stringWidth(candidate, font_name, font_size) <= max_width:
-            current = candidate
+        word_width = _text_width(word, font_name, font_size)
+        if not current:
+            current = word
+            current_width = word_width
+        elif current_width + space_width + word_width <= max_width:
+            current = f"{current} {word}"
+            current_width += space_width + word_width
         else:
             lines.append(current)
             current = word
+            current_width = word_width
     if current:
         lines.append(current)
     return lines
 
 
-def render_paystub_v1_pdf(payload: PaystubGenerateRequest) -> bytes:
-    buffer = io.BytesIO()
-    c = canvas.Canvas(buffer, pagesize=letter)
-    c.setTitle(f"{settings.project_name} Paystub")
-    c.setAuthor(settings.employer_legal_name)
-    c.setSubject(f"Paystub ID: {payload.metadata.paystub_id}")
-    c.setKeywords(
-        f"employee_id:{payload.employee.employee_id}, pay_date:{payload.pay_period.pay_date.isoformat()}"
-    )
+@lru_cache(maxsize=256)
+def _wrap_lines_cached(
+    text: str,
+    max_width: float,
+    font_name: str,
+    font_size: float,
+) -> tuple[str, ...]:
+    lines: list[str] = []
+    for line in text.splitlines():
+        lines.extend(_wrap_text(line, max_width, font_name, font_size))
+    return tuple(lines)
 
-    page_width, page_height = letter
-    margin = 54
-    content_right = page_width - margin
-    footer_height = 54
-    section_color = (0.12, 0.55, 0.6)
-    light_gray = (0.85, 0.85, 0.85)
 
-    def draw_footer():
-        generated_at = payload.metadata.generated_timestamp
-        draw_paystub_style_footer(
-            c,
-            margin=margin,
-            footer_height=footer_height,
-            generated_at=generated_at,
-            tz=ZoneInfo(settings.time_zone),
-            tz_label="PT",
+_SECTION_COLOR = (0.12, 0.55, 0.6)
+_LIGHT_GRAY = (0.85, 0.85, 0.85)
+
+
+def _draw_info_boxes(
+    c: canvas.Canvas,
+    payload: PaystubGenerateRequest,
+    y_top: float,
+    *,
+    margin: float,
+    content_right: float,
+) -> float:
+    gap = 18
+    box_width = (content_right - margin - gap)
+    box_width /= 2
+    padding = 8
+    title_height = 12
+    line_height = 11
+
+    company_lines: list[str] = [payload.company.company_name]
+    company_lines.extend(
+        _wrap_lines_cached(
+            payload.company.company_address,
+            box_width - (padding * 2),
+            "Helvetica",
+            9,
         )
+    )
+    company_lines.append(f"Payroll: {payload.company.payroll_contact_email}")
+
+    employee_lines = [
+        payload.employee.employee_name,
+        f"ID: {payload.employee.employee_id}",
+        f"{payload.employee.job_title} - {payload.employee.department}",
+        f"{payload.employee.employment_type} | {payload.employee.pay_type}",
+        f"Pay rate: {_format_rate(payload.employee.pay_rate, payload.employee.pay_type)}",
+    ]
 
-    def draw_info_boxes(y_top: float) -> float:
-        gap = 18
-        box_width = (content_right - margin - gap)
-        box_width /= 2
-        padding = 8
-        title_height = 12
-        line_height = 11
+    def calc_height(line_count: int) -> float:
+        return (padding * 2) + title_height + (line_count * line_height)
 
-        company_lines: list[str] = [payload.company.company_name]
-        for line in payload.company.company_address.splitlines():
-            company_lines.extend(
-                _wrap_text(c, line, box_width - (padding * 2), "Helvetica", 9)
-            )
-        company_lines.append(f"Payroll: {payload.company.payroll_contact_email}")
-
-        employee_lines = [
-            payload.employee.employee_name,
-            f"ID: {payload.employee.employee_id}",
-            f"{payload.employee.job_title} - {payload.employee.department}",
-            f"{payload.employee.employment_type} | {payload.employee.pay_type}",
-            f"Pay rate: {_format_rate(payload.employee.pay_rate, payload.employee.pay_type)}",
-        ]
+    box_height = max(calc_height(len(company_lines)), calc_height(len(employee_lines)))
 
-        def calc_height(line_count: int) -> float:
-            return (padding * 2) + title_height + (line_count * line_height)
+    def draw_box(x: float, title: str, lines: list[str]) -> None:
+        c.setStrokeColorRGB(*_LIGHT_GRAY)
+        c.setLineWidth(0.7)
+        c.rect(x, y_top - box_height, box_width, box_height, stroke=1, fill=0)
+        c.setFillColorRGB(0, 0, 0)
+        c.setFont("Helvetica-Bold", 9)
+        title_y = y_top - padding
+        c.drawString(x + padding, title_y, title)
+        text_y = title_y - title_height
+        c.setFont("Helvetica", 9)
+        for line in lines:
+            c.drawString(x + padding, text_y, line)
+            text_y -= line_height
 
-        box_height = max(calc_height(len(company_lines)), calc_height(len(employee_lines)))
+    draw_box(margin, "Company", company_lines)
+    draw_box(margin + box_width + gap, "Employee", employee_lines)
+    c.setStrokeColorRGB(0, 0, 0)
+    return y_top - box_height - 16
 
-        def draw_box(x: float, title: str, lines: list[str]) -> None:
-            c.setStrokeColorRGB(*light_gray)
-            c.setLineWidth(0.7)
-            c.rect(x, y_top - box_height, box_width, box_height, stroke=1, fill=0)
-            c.setFillColorRGB(0, 0, 0)
-            c.setFont("Helvetica-Bold", 9)
-            title_y = y_top - padding
-            c.drawString(x + padding, title_y, title)
-            text_y = title_y - title_height
-            c.setFont("Helvetica", 9)
-            for line in lines:
-                c.drawString(x + padding, text_y, line)
-                text_y -= line_height
 
-        draw_box(margin, "Company", company_lines)
-        draw_box(margin + box_width + gap, "Employee", employee_lines)
-        c.setStrokeColorRGB(0, 0, 0)
-        return y_top - box_height - 16
-
-    def draw_header(full: bool) -> float:
-        y = page_height - margin
-        c.setFont("Helvetica-Bold", 18)
-        c.drawString(margin, y, payload.company.company_name)
-        c.setFont("Helvetica-Bold", 14)
-        c.drawRightString(content_right, y, "EARNINGS STATEMENT")
-        y -= 16
+def _draw_header(
+    c: canvas.Canvas,
+    payload: PaystubGenerateRequest,
+    *,
+    page_height: float,
+    margin: float,
+    content_right: float,
+    full: bool,
+) -> float:
+    y = page_height - margin
+    c.setFont("Helvetica-Bold", 18)
+    c.drawString(margin, y, payload.company.company_name)
+    c.setFont("Helvetica-Bold", 14)
+    c.drawRightString(content_right, y, "EARNINGS STATEMENT")
+    y -= 16
+    c.setFont("Helvetica", 9)
+    c.drawRightString(
+        content_right,
+        y,
+        f"Pay period: {payload.pay_period.pay_period_start} - {payload.pay_period.pay_period_end}",
+    )
+    y -= 12
+    c.drawRightString(
+        content_right,
+        y,
+        f"Pay date: {payload.pay_period.pay_date.isoformat()}",
+    )
+    y -= 10
+    c.setStrokeColorRGB(*_LIGHT_GRAY)
+    c.setLineWidth(0.7)
+    c.line(margin, y, content_right, y)
+    y -= 16
+    if full:
+        y = _draw_info_boxes(c, payload, y, margin=margin, content_right=content_right)
         c.setFont("Helvetica", 9)
-        c.drawRightString(
-            content_right,
+        c.drawString(
+            margin,
             y,
-            f"Pay period: {payload.pay_period.pay_period_start} - {payload.pay_period.pay_period_end}",
+            f"Payment: {payload.payment.payment_method} ({payload.payment.bank_name_masked})",
         )
-        y -= 12
         c.drawRightString(
             content_right,
             y,
-            f"Pay date: {payload.pay_period.pay_date.isoformat()}",
+            f"Status: {payload.payment.payment_status}",
         )
-        y -= 10
-        c.setStrokeColorRGB(*light_gray)
-        c.setLineWidth(0.7)
-        c.line(margin, y, content_right, y)
-        y -= 16
-        if full:
-            y = draw_info_boxes(y)
-            c.setFont("Helvetica", 9)
-            c.drawString(
-                margin,
-                y,
-                f"Payment: {payload.payment.payment_method} ({payload.payment.bank_name_masked})",
-            )
-            c.drawRightString(
-                content_right,
-                y,
-                f"Status: {payload.payment.payment_status}",
-            )
-            y -= 18
-        c.setStrokeColorRGB(0, 0, 0)
-        c.setLineWidth(1)
-        return y
+        y -= 18
+    c.setStrokeColorRGB(0, 0, 0)
+    c.setLineWidth(1)
+    return y
 
-    def ensure_space(
-        current_y: float,
-        required_height: float,
-        on_new_page=None,
-    ) -> float:
-        minimum_y = footer_height + 20
-        if current_y - required_height < minimum_y:
-            draw_footer()
-            c.showPage()
-            current_y = draw_header(full=False)
-            if on_new_page:
-                current_y = on_new_page(current_y)
-            return current_y
+
+def _ensure_space(
+    c: canvas.Canvas,
+    payload: PaystubGenerateRequest,
+    current_y: float,
+    required_height: float,
+    *,
+    page_width: float,
+    page_height: float,
+    margin: float,
+    content_right: float,
+    footer_height: float,
+    minimum_y: float,
+    footer_stamp: str,
+    on_new_page=None,
+) -> float:
+    if current_y - required_height < minimum_y:
+        draw_paystub_style_footer(
+            c,
+            page_width=page_width,
+            margin=margin,
+            footer_height=footer_height,
+            stamp=footer_stamp,
+        )
+        c.showPage()
+        current_y = _draw_header(
+            c,
+            payload,
+            page_height=page_height,
+            margin=margin,
+            content_right=content_right,
+            full=False,
+        )
+        if on_new_page:
+            current_y = on_new_page(current_y)
         return current_y
+    return current_y
+
+
+def render_paystub_v1_pdf(payload: PaystubGenerateRequest) -> bytes:
+    buffer = io.BytesIO()
+    c = StateTrackingCanvas(buffer, pagesize=letter, pageCompression=1)
+    c.setTitle(f"{settings.project_name} Paystub")
+    c.setAuthor(settings.employer_legal_name)
+    c.setSubject(f"Paystub ID: {payload.metadata.paystub_id}")
+    c.setKeywords(
+        f"employee_id:{payload.employee.employee_id}, pay_date:{payload.pay_period.pay_date.isoformat()}"
+    )
+
+    page_width, page_height = letter
+    margin = 54
+    content_right = page_width - margin
+    footer_height = 54
+    rate_x = margin + 260
+    hours_x = margin + 330
+    current_x = margin + 430
+    minimum_y = footer_height + 20
+    footer_stamp = format_footer_stamp(
+        payload.metadata.generated_timestamp,
+        tz=APP_TZ,
+        tz_label="PT",
+    )
+
+    ensure_space = partial(
+        _ensure_space,
+        c,
+        payload,
+        page_width=page_width,
+        page_height=page_height,
+        margin=margin,
+        content_right=content_right,
+        footer_height=footer_height,
+        minimum_y=minimum_y,
+        footer_stamp=footer_stamp,
+    )
 
     def draw_section_title(title: str, current_y: float) -> float:
         c.setFont("Helvetica-Bold", 9)
         c.drawString(margin, current_y, title)
         current_y -= 6
-        c.setStrokeColorRGB(*section_color)
+        c.setStrokeColorRGB(*_SECTION_COLOR)
         c.setLineWidth(1)
         c.line(margin, current_y, content_right, current_y)
         c.setStrokeColorRGB(0, 0, 0)
         c.setLineWidth(1)
         return current_y - 10
 
-    def draw_earnings_header(current_y: float, continued: bool = False) -> float:
-        title = "Employee Earnings"
-        if continued:
-            title += " (continued)"
-        current_y = draw_section_title(title, current_y)
-        c.setFont("Helvetica-Bold", 8.5)
-        c.drawString(margin, current_y, "Description")
-        c.drawRightString(margin + 260, current_y, "Rate")
-        c.drawRightString(margin + 330, current_y, "Hours")
-        c.drawRightString(margin + 430, current_y, "Current")
-        c.drawRightString(content_right, current_y, "Year to Date")
-        current_y -= 6
-        c.setStrokeColorRGB(*light_gray)
-        c.setLineWidth(0.7)
-        c.line(margin, current_y, content_right, current_y)
-        c.setStrokeColorRGB(0, 0, 0)
-        return current_y - 10
-
-    def draw_deductions_header(current_y: float, continued: bool = False) -> float:
-        title = "Employee Deductions"
-        if continued:
-            title += " (continued)"
-        current_y = draw_section_title(title, current_y)
-        c.setFont("Helvetica-Bold", 8.5)
-        c.drawString(margin, current_y, "Description")
-        c.drawRightString(margin + 430, current_y, "Current")
-        c.drawRightString(content_right, current_y, "Year to Date")
-        current_y -= 6
-        c.setStrokeColorRGB(*light_gray)
-        c.setLineWidth(0.7)
-        c.line(margin, current_y, content_right, current_y)
-        c.setStrokeColorRGB(0, 0, 0)
-        return current_y - 10
+    earnings_columns = (
+        ("Rate", rate_x),
+        ("Hours", hours_x),
+        ("Current", current_x),
+        ("Year to Date", content_right),
+    )
+    totals_columns = (
+        ("Current", current_x),
+        ("Year to Date", content_right),
+    )
 
-    def draw_summary_header(current_y: float, continued: bool = False) -> float:
-        title = "Summary"
+    def draw_table_header(
+        title: str,
+        columns: tuple[tuple[str, float], ...],
+        current_y: float,
+        continued: bool = False,
+    ) -> float:
         if continued:
             title += " (continued)"
         current_y = draw_section_title(title, current_y)
         c.setFont("Helvetica-Bold", 8.5)
         c.drawString(margin, current_y, "Description")
-        c.drawRightString(margin + 430, current_y, "Current")
-        c.drawRightString(content_right, current_y, "Year to Date")
+        for label, x in columns:
+            c.drawRightString(x, current_y, label)
         current_y -= 6
-        c.setStrokeColorRGB(*light_gray)
+        c.setStrokeColorRGB(*_LIGHT_GRAY)
         c.setLineWidth(0.7)
         c.line(margin, current_y, content_right, current_y)
         c.setStrokeColorRGB(0, 0, 0)
@@ -281,7 +396,7 @@ def render_paystub_v1_pdf(payload: PaystubGenerateRequest) -> bytes:
         line_height = 11
         header_height = 12
         box_height = (padding * 2) + header_height + ((len(rows) + 1) * line_height) + 8
-        c.setStrokeColorRGB(*light_gray)
+        c.setStrokeColorRGB(*_LIGHT_GRAY)
         c.setLineWidth(0.7)
         c.rect(x, y_top - box_height, width, box_height, stroke=1, fill=0)
         c.setFillColorRGB(0, 0, 0)
@@ -293,7 +408,7 @@ def render_paystub_v1_pdf(payload: PaystubGenerateRequest) -> bytes:
         c.drawString(x + padding, header_y, "Description")
         c.drawRightString(x + width - padding, header_y, "Hours")
         header_y -= 6
-        c.setStrokeColorRGB(*section_color)
+        c.setStrokeColorRGB(*_SECTION_COLOR)
         c.setLineWidth(1)
         c.line(x + padding, header_y, x + width - padding, header_y)
         row_y = header_y - 10
@@ -307,44 +422,84 @@ def render_paystub_v1_pdf(payload: PaystubGenerateRequest) -> bytes:
         c.setLineWidth(1)
         return box_height
 
-    y = draw_header(full=True)
+    y = _draw_header(
+        c,
+        payload,
+        page_height=page_height,
+        margin=margin,
+        content_right=content_right,
+        full=True,
+    )
+
+    draw_string = c.drawString
+    draw_right_string = c.drawRightString
+    ytd_x = content_right
 
     c.setFont("Helvetica", 9)
     y = ensure_space(y, 70)
-    y = draw_earnings_header(y)
-    for item in payload.earnings:
-        y = ensure_space(y, 16, on_new_page=lambda new_y: draw_earnings_header(new_y, True))
-        c.drawString(margin, y, item.description)
-        c.drawRightString(margin + 260, y, _format_optional_currency(item.rate))
-        c.drawRightString(margin + 330, y, _format_optional_decimal(item.hours))
-        c.drawRightString(margin + 430, y, _format_currency(item.current_amount))
-        c.drawRightString(content_right, y, _format_currency(item.ytd_amount))
+    y = draw_table_header("Employee Earnings", earnings_columns, y)
+    continue_earnings = partial(draw_table_header, "Employee Earnings", earnings_columns, continued=True)
+    earnings_rows = [
+        (
+            item.description,
+            (
+                (rate_x, _format_optional_currency(item.rate)),
+                (hours_x, _format_optional_decimal(item.hours)),
+                (current_x, _format_currency(item.current_amount)),
+                (ytd_x, _format_currency(item.ytd_amount)),
+            ),
+        )
+        for item in payload.earnings
+    ]
+    text = c.beginText()
+    for label, cells in earnings_rows:
+        if y - 16 < minimum_y:
+            c.drawText(text)
+            y = ensure_space(y, 16, on_new_page=continue_earnings)
+            text = c.beginText()
+        add_text_row(text, y, margin, label, cells, measure=_text_width)
         y -= 12
+    c.drawText(text)
 
     c.setFont("Helvetica-Bold", 9)
     c.drawString(margin, y, "Gross Pay")
-    c.drawRightString(margin + 430, y, _format_currency(payload.totals.gross_pay_current))
+    c.drawRightString(current_x, y, _format_currency(payload.totals.gross_pay_current))
     c.drawRightString(content_right, y, _format_currency(payload.totals.gross_pay_ytd))
     y -= 18
 
     y = ensure_space(y, 70)
-    y = draw_deductions_header(y)
+    y = draw_table_header("Employee Deductions", totals_columns, y)
+    continue_deductions = partial(draw_table_header, "Employee Deductions", totals_columns, continued=True)
     c.setFont("Helvetica", 9)
-    for item in payload.deductions:
-        y = ensure_space(y, 16, on_new_page=lambda new_y: draw_deductions_header(new_y, True))
-        c.drawString(margin, y, item.deduction_name)
-        c.drawRightString(margin + 430, y, _format_currency(item.current_amount))
-        c.drawRightString(content_right, y, _format_currency(item.ytd_amount))
+    deduction_rows = [
+        (
+            item.deduction_name,
+            (
+                (current_x, _format_currency(item.current_amount)),
+                (ytd_x, _format_currency(item.ytd_amount)),
+            ),
+        )
+        for item in payload.deductions
+    ]
+    text = c.beginText()
+    for label, cells in deduction_rows:
+        if y - 16 < minimum_y:
+            c.drawText(text)
+            y = ensure_space(y, 16, on_new_page=continue_deductions)
+            text = c.beginText()
+        add_text_row(text, y, margin, label, cells, measure=_text_width)
         y -= 12
+    c.drawText(text)
 
     c.setFont("Helvetica-Bold", 9)
     c.drawString(margin, y, "Total Deductions")
-    c.drawRightString(margin + 430, y, _format_currency(payload.totals.total_deductions_current))
+    c.drawRightString(current_x, y, _format_currency(payload.totals.total_deductions_current))
     c.drawRightString(content_right, y, _format_currency(payload.totals.total_deductions_ytd))
     y -= 24
 
     y = ensure_space(y, 60)
-    y = draw_summary_header(y)
+    y = draw_table_header("Summary", totals_columns, y)
+    continue_summary = partial(draw_table_header, "Summary", totals_columns, continued=True)
     c.setFont("Helvetica", 9)
     summary_rows = [
         ("Gross Earnings", payload.totals.gross_pay_current, payload.totals.gross_pay_ytd),
@@ -352,14 +507,14 @@ def render_paystub_v1_pdf(payload: PaystubGenerateRequest) -> bytes:
         ("Net Pay", payload.totals.net_pay_current, payload.totals.net_pay_ytd),
     ]
     for label, current_value, ytd_value in summary_rows:
-        y = ensure_space(y, 16, on_new_page=lambda new_y: draw_summary_header(new_y, True))
+        y = ensure_space(y, 16, on_new_page=continue_summary)
         if label == "Net Pay":
             c.setFont("Helvetica-Bold", 9)
         else:
             c.setFont("Helvetica", 9)
-        c.drawString(margin, y, label)
-        c.drawRightString(margin + 430, y, _format_currency(current_value))
-        c.drawRightString(content_right, y, _format_currency(ytd_value))
+        draw_string(margin, y, label)
+        draw_right_string(current_x, y, _format_currency(current_value))
+        draw_right_string(ytd_x, y, _format_currency(ytd_value))
         y -= 12
 
     if payload.leave_balances is not None:
@@ -395,9 +550,45 @@ def render_paystub_v1_pdf(payload: PaystubGenerateRequest) -> bytes:
         )
         y = box_top - max(vacation_height, sick_height) - 16
 
-    draw_footer()
+    draw_paystub_style_footer(
+        c,
+        page_width=page_width,
+        margin=margin,
+        footer_height=footer_height,
+        stamp=footer_stamp,
+    )
     c.showPage()
     c.save()
 
-    buffer.seek(0)
-    return buffer.read()
+    return buffer.getvalue()
+
+
+def _paystub_cache_key(payload: PaystubGenerateRequest) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (_RENDER_VERSION, settings.project_name, settings.employer_legal_name, settings.time_zone):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    digest.update(payload.model_dump_json().encode())
+    return digest.hexdigest()
+
+
+def render_paystub_v1_pdf_cached(payload: PaystubGenerateRequest) -> bytes:
+    if not settings.paystub_render_cache_dir:
+        return render_paystub_v1_pdf(payload)
+    path = Path(settings.paystub_render_cache_dir) / f"{_paystub_cache_key(payload)}.pdf"
+    try:
+        return path.read_bytes()
+    except OSError:
+        pass
+    pdf_bytes = render_paystub_v1_pdf(payload)
+    tmp_name = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp_file:
+            tmp_name = tmp_file.name
+            tmp_file.write(pdf_bytes)
+        Path(tmp_name).replace(path)
+    except OSError:
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+    return pdf_bytes
@@ -1,11 +1,15 @@
 import io
 import re
+from collections.abc import Callable
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from html import escape
 from zoneinfo import ZoneInfo
 
 from reportlab.lib.pagesizes import letter
+from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfgen import canvas
+from reportlab.pdfgen.textobject import PDFTextObject
 
 from app.core.config import settings
 
@@ -14,24 +18,72 @@ try:
 except Exception:  # pragma: no cover - fallback handled at runtime
     FPDF = None
 
+APP_TZ = ZoneInfo(settings.time_zone)
+_UTC = timezone.utc
+
+
+# ReportLab already tracks the active font and colours (resetting them on
+# showPage/restoreState) but still emits a PDF operator on every call; skip
+# the ones that would not change anything.
+class StateTrackingCanvas(canvas.Canvas):
+    def setFont(self, psfontname, size, leading=None):
+        if leading is None:
+            leading = size * 1.2
+        if (
+            psfontname == self._fontname
+            and size == self._fontsize
+            and leading == self._leading
+        ):
+            return
+        super().setFont(psfontname, size, leading)
+
+    def setFillColorRGB(self, r, g, b, alpha=None):
+        if alpha is None and self._fillColorObj == (r, g, b):
+            return
+        super().setFillColorRGB(r, g, b, alpha)
+
+    def setStrokeColorRGB(self, r, g, b, alpha=None):
+        if alpha is None and self._strokeColorObj == (r, g, b):
+            return
+        super().setStrokeColorRGB(r, g, b, alpha)
+
+    def setLineWidth(self, width):
+        if width == self._lineWidth:
+            return
+        super().setLineWidth(width)
+
+
+def format_footer_stamp(
+    generated_at: datetime,
+    *,
+    tz: ZoneInfo | None = None,
+    tz_label: str = "UTC",
+) -> str:
+    footer_time = generated_at
+    if footer_time.tzinfo is None:
+        footer_time = footer_time.replace(tzinfo=tz or _UTC)
+    if tz is not None:
+        footer_time = footer_time.astimezone(tz)
+    local_time = footer_time.replace(tzinfo=None)
+    return f"{local_time.isoformat(sep=' ', timespec='seconds')} {tz_label}"
+
 
 def draw_paystub_style_footer(
     c: canvas.Canvas,
     *,
+    page_width: float,
     margin: float,
     footer_height: float,
-    generated_at: datetime,
+    generated_at: datetime | None = None,
     tz: ZoneInfo | None = None,
     tz_label: str = "UTC",
+    stamp: str | None = None,
 ) -> None:
-    footer_time = generated_at
-    if footer_time.tzinfo is None:
-        footer_time = footer_time.replace(tzinfo=tz or timezone.utc)
-    if tz is not None:
-        footer_time = footer_time.astimezone(tz)
-    stamp = f"{footer_time.strftime('%Y-%m-%d %H:%M:%S')} {tz_label}"
+    if stamp is None:
+        if generated_at is None:
+            raise TypeError("draw_paystub_style_footer() requires generated_at or stamp")
+        stamp = format_footer_stamp(generated_at, tz=tz, tz_label=tz_label)
 
-    page_width = c._pagesize[0]
     c.setFont("Helvetica", 8)
     c.setFillColorRGB(0, 0, 0)
     c.line(margin, footer_height, page_width - margin, footer_height)
@@ -43,6 +95,22 @@ def draw_paystub_style_footer(
     c.drawString(margin, footer_height - 28, f"Generated on: {stamp}")
 
 
+def add_text_row(
+    text: PDFTextObject,
+    y: float,
+    x: float,
+    label: str,
+    right_cells: tuple[tuple[float, str], ...],
+    *,
+    measure: Callable[[str, str, float], float] = pdfmetrics.stringWidth,
+) -> None:
+    text.setTextOrigin(x, y)
+    text.textLine(label)
+    for right_x, value in right_cells:
+        text.setTextOrigin(right_x - measure(value, text._fontname, text._fontsize), y)
+        text.textLine(value)
+
+
 def _looks_like_html(content: str) -> bool:
     return bool(re.search(r"<[A-Za-z][^>]*>", content))
 
@@ -78,16 +146,24 @@ def _document_body_to_html(body: str) -> str:
     return "\n".join(paragraphs)
 
 
-def _render_document_pdf_html(document) -> bytes:
+def _resolve_generated_at(generated_at: datetime | None) -> datetime:
+    if generated_at is None:
+        return datetime.now(APP_TZ)
+    return generated_at.astimezone(APP_TZ)
+
+
+def _render_document_pdf_html(document, generated_at: datetime | None = None) -> bytes:
     if FPDF is None:
         raise RuntimeError("fpdf2 is not installed")
 
-    now = datetime.now(ZoneInfo(settings.time_zone))
+    now = _resolve_generated_at(generated_at)
+    project = _to_latin1_safe(settings.project_name)
+    employer = _to_latin1_safe(settings.employer_legal_name)
     generated_from = _to_latin1_safe(settings.base_url.strip() or "Kyronix Core")
     body_html = _document_body_to_html(document.body or "")
     html = f"""
-<h1>{escape(_to_latin1_safe(settings.project_name))}</h1>
-<p><b>Employer:</b> {escape(_to_latin1_safe(settings.employer_legal_name))}<br/>
+<h1>{escape(project)}</h1>
+<p><b>Employer:</b> {escape(employer)}<br/>
 <b>Document ID:</b> {document.id}<br/>
 <b>Generated:</b> {escape(_to_latin1_safe(now.isoformat()))}</p>
 <hr/>
@@ -98,8 +174,8 @@ def _render_document_pdf_html(document) -> bytes:
 """
 
     pdf = FPDF(orientation="P", unit="pt", format="Letter")
-    pdf.set_title(_to_latin1_safe(f"{settings.project_name} Document"))
-    pdf.set_author(_to_latin1_safe(settings.employer_legal_name))
+    pdf.set_title(f"{project} Document")
+    pdf.set_author(employer)
     pdf.set_auto_page_break(auto=True, margin=54)
     pdf.set_margins(54, 54, 54)
     pdf.add_page()
@@ -107,16 +183,17 @@ def _render_document_pdf_html(document) -> bytes:
     return bytes(pdf.output(dest="S"))
 
 
-def _render_document_pdf_reportlab(document) -> bytes:
+def _render_document_pdf_reportlab(document, generated_at: datetime | None = None) -> bytes:
     buffer = io.BytesIO()
-    c = canvas.Canvas(buffer, pagesize=letter)
-    c.setTitle(f"{settings.project_name} Document")
+    project = settings.project_name
+    c = StateTrackingCanvas(buffer, pagesize=letter, pageCompression=1)
+    c.setTitle(f"{project} Document")
 
-    now = datetime.now(ZoneInfo(settings.time_zone))
+    now = _resolve_generated_at(generated_at)
     y = 760
 
     c.setFont("Helvetica-Bold", 16)
-    c.drawString(72, y, settings.project_name)
+    c.drawString(72, y, project)
     y -= 24
 
     c.setFont("Helvetica", 11)
@@ -131,73 +208,105 @@ def _render_document_pdf_reportlab(document) -> bytes:
 
     c.setFont("Helvetica", 10)
     text = c.beginText(72, y)
-    for line in (document.body or "").splitlines():
-        text.textLine(line)
+    text.textLines((document.body or "").splitlines())
     c.drawText(text)
     c.showPage()
     c.save()
 
-    buffer.seek(0)
-    return buffer.read()
+    return buffer.getvalue()
 
 
-def render_document_pdf(document) -> bytes:
+def render_document_pdf(document, *, generated_at: datetime | None = None) -> bytes:
     try:
-        return _render_document_pdf_html(document)
+        return _render_document_pdf_html(document, generated_at)
     except Exception:
-        return _render_document_pdf_reportlab(document)
+        return _render_document_pdf_reportlab(document, generated_at)
+
+
+def _as_amount(value: object) -> float:
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    if value is None:
+        return 0.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _format_currency(value: object) -> str:
+    return f"${_as_amount(value):,.2f}"
+
+
+def _format_number(value: object) -> str:
+    return f"{value:.2f}" if isinstance(value, (int, float)) else "-"
 
 
-def render_paystub_pdf(paystub) -> bytes:
+def _format_rate(value: object) -> str:
+    return _format_currency(value) if isinstance(value, (int, float)) else "-"
+
+
+@lru_cache(maxsize=256)
+def _cached_string_width(text: str, font_name: str, font_size: float) -> float:
+    return pdfmetrics.stringWidth(text, font_name, font_size)
+
+
+def _sum_amounts(items: list[dict]) -> float:
+    total = 0.0
+    for item in items:
+        value = item.get("amount")
+        value_type = type(value)
+        if value_type is float or value_type is int:
+            total += value
+        else:
+            total += _as_amount(value)
+    return total
+
+
+def render_paystub_pdf(paystub, *, generated_at: datetime | None = None) -> bytes:
     buffer = io.BytesIO()
-    c = canvas.Canvas(buffer, pagesize=letter)
+    employer = settings.employer_legal_name
+    c = StateTrackingCanvas(buffer, pagesize=letter, pageCompression=1)
     c.setTitle(f"{settings.project_name} Paystub")
-    c.setAuthor(settings.employer_legal_name)
+    c.setAuthor(employer)
     c.setSubject(f"Paystub ID: {paystub.id}")
     c.setKeywords(f"user_id:{paystub.user_id}, pay_date:{paystub.pay_date.isoformat()}")
 
     page_width, page_height = letter
-    now = datetime.now(ZoneInfo(settings.time_zone))
+    now = _resolve_generated_at(generated_at)
     earnings = paystub.earnings or []
     deductions = paystub.deductions or []
     margin = 72
     content_right = page_width - margin
     footer_height = 72
+    minimum_y = footer_height + 20
     section_color = (0.12, 0.55, 0.6)
     light_gray = (0.85, 0.85, 0.85)
 
-    def as_amount(value):
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return 0.0
-
-    def format_currency(value):
-        return f"${as_amount(value):,.2f}"
-
-    def format_number(value):
-        return f"{value:.2f}" if isinstance(value, (int, float)) else "-"
-
     gross_pay = float(paystub.gross_pay or 0)
     if gross_pay == 0:
-        gross_pay = sum(as_amount(item.get("amount")) for item in earnings)
+        gross_pay = _sum_amounts(earnings)
 
     total_deductions = float(paystub.total_deductions or 0)
     if total_deductions == 0:
-        total_deductions = sum(as_amount(item.get("amount")) for item in deductions)
+        total_deductions = _sum_amounts(deductions)
 
     net_pay = float(paystub.net_pay or 0)
     if net_pay == 0:
         net_pay = gross_pay - total_deductions
 
+    footer_stamp = format_footer_stamp(now, tz=APP_TZ, tz_label="PT")
+
     def draw_footer():
         draw_paystub_style_footer(
             c,
+            page_width=page_width,
             margin=margin,
             footer_height=footer_height,
-            generated_at=now,
-            tz=ZoneInfo(settings.time_zone),
-            tz_label="PT",
+            stamp=footer_stamp,
         )
 
     def draw_info_boxes(y_top: float) -> float:
@@ -208,7 +317,7 @@ def render_paystub_pdf(paystub) -> bytes:
         title_height = 12
         line_height = 11
 
-        company_lines = [settings.employer_legal_name]
+        company_lines = [employer]
         employee_lines = [
             f"{paystub.employee_first_name} {paystub.employee_last_name}",
             f"Pay period: {paystub.pay_period_start} - {paystub.pay_period_end}",
@@ -243,7 +352,7 @@ def render_paystub_pdf(paystub) -> bytes:
     def draw_header(full: bool) -> float:
         y = page_height - margin
         c.setFont("Helvetica-Bold", 18)
-        c.drawString(margin, y, settings.employer_legal_name)
+        c.drawString(margin, y, employer)
         c.setFont("Helvetica-Bold", 14)
         c.drawRightString(content_right, y, "EARNINGS STATEMENT")
         y -= 16
@@ -267,7 +376,7 @@ def render_paystub_pdf(paystub) -> bytes:
         return y
 
     def ensure_space(current_y: float, required_height: float, on_new_page=None) -> float:
-        if current_y - required_height < footer_height + 20:
+        if current_y - required_height < minimum_y:
             draw_footer()
             c.showPage()
             current_y = draw_header(full=False)
@@ -338,64 +447,82 @@ def render_paystub_pdf(paystub) -> bytes:
 
     y = ensure_space(y, 70)
     y = draw_earnings_header(y)
+    continue_earnings = partial(draw_earnings_header, continued=True)
+    earnings_rows = [
+        (
+            str(line.get("label") or "Earnings"),
+            (
+                (margin + 300, _format_number(line.get("hours"))),
+                (margin + 380, _format_rate(line.get("rate"))),
+                (content_right, _format_currency(line.get("amount"))),
+            ),
+        )
+        for line in (item or {} for item in earnings)
+    ]
     c.setFont("Helvetica", 9)
-    for item in earnings:
-        y = ensure_space(y, 16, on_new_page=lambda new_y: draw_earnings_header(new_y, True))
-        line = item or {}
-        description = str(line.get("label") or "Earnings")
-        hours = line.get("hours")
-        rate = line.get("rate")
-        amount = line.get("amount")
-        c.drawString(margin, y, description)
-        c.drawRightString(margin + 300, y, format_number(hours))
-        c.drawRightString(margin + 380, y, format_currency(rate) if isinstance(rate, (int, float)) else "-")
-        c.drawRightString(content_right, y, format_currency(amount))
+    text = c.beginText()
+    for description, cells in earnings_rows:
+        if y - 16 < minimum_y:
+            c.drawText(text)
+            y = ensure_space(y, 16, on_new_page=continue_earnings)
+            text = c.beginText()
+        add_text_row(text, y, margin, description, cells, measure=_cached_string_width)
         y -= 12
+    c.drawText(text)
 
     c.setFont("Helvetica-Bold", 9)
     c.drawString(margin, y, "Gross Pay")
-    c.drawRightString(content_right, y, format_currency(gross_pay))
+    c.drawRightString(content_right, y, _format_currency(gross_pay))
     y -= 18
 
     if deductions:
         y = ensure_space(y, 60)
         y = draw_deductions_header(y)
+        continue_deductions = partial(draw_deductions_header, continued=True)
+        deduction_rows = [
+            (
+                str(line.get("label") or "Deduction"),
+                ((content_right, _format_currency(line.get("amount"))),),
+            )
+            for line in (item or {} for item in deductions)
+        ]
         c.setFont("Helvetica", 9)
-        for item in deductions:
-            y = ensure_space(y, 16, on_new_page=lambda new_y: draw_deductions_header(new_y, True))
-            line = item or {}
-            label = str(line.get("label") or "Deduction")
-            amount = line.get("amount")
-            c.drawString(margin, y, label)
-            c.drawRightString(content_right, y, format_currency(amount))
+        text = c.beginText()
+        for label, cells in deduction_rows:
+            if y - 16 < minimum_y:
+                c.drawText(text)
+                y = ensure_space(y, 16, on_new_page=continue_deductions)
+                text = c.beginText()
+            add_text_row(text, y, margin, label, cells, measure=_cached_string_width)
             y -= 12
+        c.drawText(text)
         c.setFont("Helvetica-Bold", 9)
         c.drawString(margin, y, "Total Deductions")
-        c.drawRightString(content_right, y, format_currency(total_deductions))
+        c.drawRightString(content_right, y, _format_currency(total_deductions))
         y -= 18
     else:
         y -= 8
 
     y = ensure_space(y, 50)
     y = draw_summary_header(y)
+    continue_summary = partial(draw_summary_header, continued=True)
     summary_rows = [
         ("Gross Earnings", gross_pay),
         ("Total Deductions", total_deductions),
         ("Net Pay", net_pay),
     ]
     for label, amount in summary_rows:
-        y = ensure_space(y, 16, on_new_page=lambda new_y: draw_summary_header(new_y, True))
+        y = ensure_space(y, 16, on_new_page=continue_summary)
         if label == "Net Pay":
             c.setFont("Helvetica-Bold", 9)
         else:
             c.setFont("Helvetica", 9)
         c.drawString(margin, y, label)
-        c.drawRightString(content_right, y, format_currency(amount))
+        c.drawRightString(content_right, y, _format_currency(amount))
         y -= 12
 
     draw_footer()
     c.showPage()
     c.save()
 
-    buffer.seek(0)
-    return buffer.read()
+    return buffer.getvalue()
@@ -1,17 +1,37 @@
+import base64
+import hashlib
+from collections.abc import Iterator
 from functools import lru_cache
+from typing import BinaryIO
 
 import boto3
-from botocore.exceptions import ClientError
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+from botocore.response import StreamingBody
 
 from app.core.config import settings
 
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    use_threads=True,
+    max_concurrency=4,
+)
+
 
 class S3ConfigError(RuntimeError):
     pass
 
 
 def _build_client_kwargs() -> dict:
-    kwargs: dict = {}
+    kwargs: dict = {
+        "config": Config(
+            max_pool_connections=64,
+            tcp_keepalive=True,
+            retries={"mode": "adaptive", "max_attempts": 5},
+        ),
+    }
     if settings.s3_region:
         kwargs["region_name"] = settings.s3_region
     if settings.s3_access_key_id and settings.s3_secret_access_key:
@@ -29,6 +49,13 @@ def get_s3_client():
     return boto3.client("s3", **_build_client_kwargs())
 
 
+def warm_s3_client(client) -> None:
+    try:
+        client.head_bucket(Bucket=settings.s3_bucket)
+    except (BotoCoreError, ClientError):
+        pass
+
+
 def upload_file_bytes(
     key: str,
     content: bytes,
@@ -37,11 +64,13 @@ def upload_file_bytes(
     metadata: dict | None = None,
 ) -> None:
     client = get_s3_client()
+    content_md5 = hashlib.md5(content, usedforsecurity=False).digest()
     try:
         client.put_object(
             Bucket=settings.s3_bucket,
             Key=key,
             Body=content,
+            ContentMD5=base64.b64encode(content_md5).decode(),
             ContentType=content_type,
             Metadata=metadata or {},
         )
@@ -49,6 +78,26 @@ def upload_file_bytes(
         raise S3ConfigError(f"Failed to upload file to S3: {exc}") from exc
 
 
+def upload_file_stream(
+    key: str,
+    fileobj: BinaryIO,
+    *,
+    content_type: str = "application/octet-stream",
+    metadata: dict | None = None,
+) -> None:
+    client = get_s3_client()
+    try:
+        client.upload_fileobj(
+            fileobj,
+            settings.s3_bucket,
+            key,
+            ExtraArgs={"ContentType": content_type, "Metadata": metadata or {}},
+            Config=_TRANSFER_CONFIG,
+        )
+    except (ClientError, S3UploadFailedError) as exc:
+        raise S3ConfigError(f"Failed to upload file to S3: {exc}") from exc
+
+
 def download_file_bytes(key: str) -> bytes:
     client = get_s3_client()
     try:
@@ -59,6 +108,22 @@ def download_file_bytes(key: str) -> bytes:
         raise S3ConfigError(f"Failed to download file from S3: {exc}") from exc
 
 
+def open_file_stream(key: str) -> tuple[StreamingBody, int]:
+    client = get_s3_client()
+    try:
+        response = client.get_object(Bucket=settings.s3_bucket, Key=key)
+    except ClientError as exc:
+        raise S3ConfigError(f"Failed to download file from S3: {exc}") from exc
+    return response["Body"], response["ContentLength"]
+
+
+def iter_stream_chunks(body: StreamingBody, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    try:
+        yield from body.iter_chunks(chunk_size)
+    finally:
+        body.close()
+
+
 def delete_file_bytes(key: str) -> None:
     client = get_s3_client()
     try:
@@ -76,9 +141,22 @@ def upload_pdf_bytes(key: str, content: bytes, metadata: dict | None = None) ->
     )
 
 
+def upload_pdf_stream(key: str, fileobj: BinaryIO, metadata: dict | None = None) -> None:
+    upload_file_stream(
+        key,
+        fileobj,
+        content_type="application/pdf",
+        metadata=metadata,
+    )
+
+
 def download_pdf_bytes(key: str) -> bytes:
     return download_file_bytes(key)
 
 
+def open_pdf_stream(key: str) -> tuple[StreamingBody, int]:
+    return open_file_stream(key)
+
+
 def delete_pdf_bytes(key: str) -> None:
     delete_file_bytes(key)